@@ -1,23 +1,52 @@
 import argparse
 import collections
+import concurrent.futures
+import contextlib
 import functools
+import hashlib
 import json
 import logging
+import mmap
 import os
 import pathlib
+import pickle
 import platform
+import queue
+import re
 import subprocess
 import tempfile
+import threading
+import time
 import urllib.parse
-from typing import Any, Dict, FrozenSet, List, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import requests
-import tqdm
-import vvm
-import vvm.install
 from appdirs import user_cache_dir, user_log_dir
 from semantic_version import SimpleSpec, Version
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    import requests
+
+__version__ = "0.1.0"
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +54,30 @@ class PlatformError(Exception):
     ...
 
 
+_AMD64 = frozenset({"amd64", "x86_64", "i386", "i586", "i686"})
+_ARM64 = frozenset({"aarch64_be", "aarch64", "armv8b", "armv8l"})
+
+
+def _detect_platform() -> Optional[str]:
+    """Platform identifier of the host, or ``None`` if unsupported.
+
+    See `Stack Overflow <https://stackoverflow.com/a/45125525>`_.
+    """
+    system, machine = platform.system(), platform.machine().lower()
+    if system == "Linux" and machine in _AMD64:
+        return "linux-amd64"
+    elif system == "Linux" and machine in _ARM64:
+        return "linux-arm64"
+    elif system == "Darwin" and machine in _AMD64:
+        return "macosx-amd64"
+    elif system == "Darwin" and machine in _ARM64:
+        return "macosx-arm64"
+    return None
+
+
+_PLATFORM_ID = _detect_platform()
+
+
 class Config(collections.UserDict):
     """Configuration container with attribute access support."""
 
@@ -42,121 +95,383 @@ class Config(collections.UserDict):
         "verbosity": int,
         "vyper_version": Version,
     }
+    ENV_VARS = {k: (__name__ + "_" + k).upper() for k in CONVERTERS}
 
     def __init__(self, **kwargs: Any) -> None:
-        env, prefix = {}, __name__ + "_"
-        for k, v in os.environ.items():
-            if not k.startswith(prefix.upper()):
-                continue
-            key = k.lower()[len(prefix) :]
-            env[key] = self.CONVERTERS[key](v)  # type: ignore
+        env = {
+            k: self.CONVERTERS[k](v)  # type: ignore
+            for k, name in self.ENV_VARS.items()
+            if (v := os.environ.get(name)) is not None
+        }
 
         user = {
             k: self.CONVERTERS[k](v)  # type: ignore
             for k, v in kwargs.items()
             if v is not None
         }
-        self.data = collections.ChainMap(user, env, self.DEFAULTS)  # type: ignore
+        self.data = {**self.DEFAULTS, **env, **user}
+
+
+_parse_version = functools.lru_cache(maxsize=None)(Version.parse)
+
+
+def _is_version(version_string: str) -> bool:
+    """Whether `version_string` is a valid semver version."""
+    try:
+        _parse_version(version_string)
+    except ValueError:
+        return False
+    return True
 
 
 class BinaryVersion(Version):
-    def __init__(self, *args, location: str, **kwargs):
+    def __init__(
+        self,
+        *args,
+        location: str,
+        sha: Optional[str] = None,
+        size: Optional[int] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.location = location
+        # git blob SHA-1 and size, as published by the GitHub contents API
+        self.sha = sha
+        self.size = size
+        # versions are not mutated after construction, compute identity once
+        self._key = (
+            self.major,
+            self.minor,
+            self.patch,
+            self.prerelease or (),
+            self.build or (),
+        )
+        self._hash = hash(self._key)
+
+    @classmethod
+    def from_string(cls, version_string: str, **kwargs: Any) -> "BinaryVersion":
+        """Build a version from `version_string`, parsing each string only once."""
+        major, minor, patch, prerelease, build = _parse_version(version_string)
+        return cls(
+            major=major,
+            minor=minor,
+            patch=patch,
+            prerelease=prerelease,
+            build=build,
+            **kwargs,
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # str hashes are salted per process, recompute when unpickled
+        self.__dict__.update(state)
+        self._hash = hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BinaryVersion):
+            return super().__eq__(other)
+        return self._key == other._key
+
+
+def _atomic_write(fp: pathlib.Path, data: bytes) -> None:
+    """Write `data` to `fp` so that readers never observe a partial file."""
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=fp.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, fp)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _preallocate(f: BinaryIO, size: int) -> None:
+    """Reserve `size` bytes for `f`, as contiguous extents where supported."""
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except (AttributeError, OSError):
+        # unavailable on macOS, or unsupported by the filesystem
+        os.ftruncate(f.fileno(), size)
 
 
 class VersionManager:
     """zkVyper Version Manager."""
 
-    _AMD64 = ("amd64", "x86_64", "i386", "i586", "i686")
-    _ARM64 = ("aarch64_be", "aarch64", "armv8b", "armv8l")
     _REMOTE_BASE_URL = "https://api.github.com/repos/matter-labs/zkvyper-bin/contents/"
+    _CHUNK_SIZE = 1 << 16
+    _BUFFER_SIZE = 1 << 20
+    _PROGRESS_BATCH = 16
+    _RANGE_PART_SIZE = 4 << 20
+    _RANGE_WORKERS = 8
+    _REMOTE_TTL = 300
+    _VERSION_PATTERN = r"(\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?)"
+    _LOCAL_NAME_RE = re.compile(r"^zkvyper-" + _VERSION_PATTERN + "$")
+    _REMOTE_NAME_RE = re.compile(r"^zkvyper-.*-v" + _VERSION_PATTERN + "$")
 
     def __init__(self, config: Config) -> None:
-        self._session = requests.Session()
         self._config = config
-
-        log_file: pathlib.Path = config["log_file"]
-        if not log_file.exists():
-            log_file.parent.mkdir(parents=True)
-
+        # scan mtime, versions, and the versions sorted newest first
+        self._local_cache: Optional[
+            Tuple[int, FrozenSet[BinaryVersion], Tuple[BinaryVersion, ...]]
+        ] = None
         self._logger = self._get_logger()
 
     def compile(self, files: List[Union[str, pathlib.Path]]):
-        needs_vyper = (
-            self._config["vyper_version"] not in vvm.get_installed_vyper_versions()
-        )
-        if needs_vyper:
-            vvm.install_vyper(self._config["vyper_version"])
-        zkvyper = self._config["zk_version"].select(self.local_versions)
-        if not zkvyper:
-            selected = self._config["zk_version"].select(self.remote_versions)
-            if not selected:
-                version = self._config["zk_version"]
-                self._logger.error(
-                    f"zkVyper version meeting constraints not available: {version!s}"
-                )
-                raise Exception()
-
-            self.install(selected)
-            zkvyper = self._config["zk_version"].select(self.local_versions)
-        zkvyper = pathlib.Path(urllib.parse.urlparse(zkvyper.location).path)
+        import vvm
+        import vvm.install
 
+        vyper_version = self._config["vyper_version"]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            # vyper and zkVyper downloads are independent, overlap them
+            vyper_future = None
+            if vyper_version not in vvm.get_installed_vyper_versions():
+                vyper_future = executor.submit(vvm.install_vyper, vyper_version)
+
+            zkvyper = _select(self._config["zk_version"], self._local_sorted)
+            if zkvyper is None:
+                selected = _select(self._config["zk_version"], self._remote_sorted)
+                if selected is None:
+                    spec = self._config["zk_version"]
+                    self._logger.error(
+                        f"zkVyper version meeting constraints not available: {spec!s}"
+                    )
+                    raise Exception()
+                zkvyper = self._install_zkvyper(selected)
+
+            if vyper_future is not None:
+                vyper_future.result()
+
+        zkvyper_path = _uri_to_path(zkvyper.location)
         vyper = vvm.install.get_executable(self._config["vyper_version"])
-        ret = subprocess.run(
-            [zkvyper, "--vyper", vyper, "-f", "combined_json", *files],
-            capture_output=True,
-        )
-
-        return json.loads(ret.stdout.decode().strip())
+        with tempfile.TemporaryFile() as out:
+            try:
+                subprocess.run(
+                    [zkvyper_path, "--vyper", vyper, "-f", "combined_json", *files],
+                    stdout=out,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as exc:
+                self._logger.error(exc.stderr.decode(errors="replace"))
+                raise
+            return _load_file(out)
 
     def install(
         self,
         version: BinaryVersion,
         overwrite: bool = False,
         show_progress: bool = False,
-    ):
+    ) -> BinaryVersion:
         show_progress = show_progress or self._config["verbosity"] <= logging.INFO
+        self._install_vyper(show_progress)
+        return self._install_zkvyper(version, overwrite, show_progress)
+
+    def install_many(
+        self,
+        versions: Iterable[BinaryVersion],
+        overwrite: bool = False,
+        show_progress: bool = False,
+        max_workers: int = 4,
+    ) -> List[BinaryVersion]:
+        """Install several zkVyper versions concurrently.
+
+        The installs share the session's connection pool, and duplicate versions
+        are installed once. The first failure is re-raised once all installs have
+        finished.
+        """
+        show_progress = show_progress or self._config["verbosity"] <= logging.INFO
+        # vyper is shared by every version, install it before fanning out
+        self._install_vyper(show_progress)
+        # two workers must never write the same file
+        versions = list(dict.fromkeys(versions))
+        # build the session here, cached_property is not safe to race on
+        _ = self._session
+        # split the range workers between installs to stay within the pool
+        range_workers = max(1, self._RANGE_WORKERS // max_workers)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._install_zkvyper, v, overwrite, show_progress, range_workers
+                )
+                for v in versions
+            ]
+        return [future.result() for future in futures]
+
+    def _install_vyper(self, show_progress: bool = False) -> None:
+        import vvm
+
         vyper_version = self._config["vyper_version"]
         if vyper_version not in vvm.get_installed_vyper_versions():
             self._logger.info(f"Attempting to install vyper version {vyper_version!s}")
             vvm.install_vyper(vyper_version, show_progress)
             self._logger.info(f"Vyper version v{vyper_version!s} installed.")
 
+    def _install_zkvyper(
+        self,
+        version: BinaryVersion,
+        overwrite: bool = False,
+        show_progress: bool = False,
+        range_workers: Optional[int] = None,
+    ) -> BinaryVersion:
+        show_progress = show_progress or self._config["verbosity"] <= logging.INFO
+        fp: pathlib.Path = self._config["cache_dir"] / ("zkvyper-" + str(version))
+        installed = BinaryVersion.from_string(str(version), location=_path_to_uri(fp))
         if version in self.local_versions and not overwrite:
-            return
+            return installed
 
         self._logger.debug(
             f"Installing zkVyper v{version!s} from {version.location!r}."
         )
-        resp = self._session.get(version.location, stream=show_progress)
-
-        fp: pathlib.Path = self._config["cache_dir"] / ("zkvyper-" + str(version))
-        f = fp.open("wb")
+        digest = None
+        if version.sha is not None and version.size is not None:
+            digest = hashlib.sha1(b"blob %d\0" % version.size)
         try:
-            if show_progress:
-                with tqdm.tqdm(
-                    total=int(resp.headers["content-length"]),
-                    unit="b",
-                    unit_scale=True,
-                    desc=f"zkVyper v{version!s}",
-                ) as prog:
-                    for chunk in resp.iter_content():
-                        f.write(chunk)
-                        prog.update(len(chunk))
-            else:
-                f.write(resp.content)
+            url, size, ranged = self._probe(version.location)
+            with fp.open("wb", buffering=self._BUFFER_SIZE) as f:
+                os.fchmod(f.fileno(), 0o755)
+                if size is not None:
+                    _preallocate(f, size)
+                with self._progress_bar(version, size, show_progress) as prog:
+                    if ranged and size is not None:
+                        self._download_ranges(url, f, size, prog, range_workers)
+                    else:
+                        # releasing the response returns its connection to the pool
+                        with self._session.get(url, stream=True) as resp:
+                            resp.raise_for_status()
+                            self._write_body(resp, f, prog, digest)
+                        # drop any preallocated tail the decoded body did not fill
+                        f.truncate()
+            if ranged and digest is not None:
+                with fp.open("rb") as f:
+                    while chunk := f.read(self._BUFFER_SIZE):
+                        digest.update(chunk)
         except BaseException as exc:
-            f.close()
-            fp.unlink()
+            fp.unlink(missing_ok=True)
             self._logger.error(f"Installation of v{version!s} failed.")
             self._logger.debug("", exc_info=exc)
             raise
 
-        f.close()
-        fp.chmod(0o755)
         # check binary is correct
-        ret = subprocess.run([fp.as_posix(), "--version"], capture_output=True)
+        if digest is not None:
+            if digest.hexdigest() != version.sha:
+                self._logger.error(
+                    f"Checksum mismatch for zkVyper v{version}, download corrupted."
+                )
+                fp.unlink()
+                raise Exception()
+        else:
+            self._check_binary(fp, version)
+
+        self._logger.debug(f"Installation of v{version!s} finished.")
+        # mtime granularity may hide the write, drop the cached scan explicitly
+        self._local_cache = None
+        return installed
+
+    def _probe(self, url: str) -> Tuple[str, Optional[int], bool]:
+        """Resolve `url`, returning its final location, size and range support.
+
+        If the ``HEAD`` request fails, `url` is returned as is and the download
+        falls back to a single streaming ``GET``.
+        """
+        import requests
+
+        try:
+            resp = self._session.head(url, allow_redirects=True)
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            # e.g. signed CDN URLs rejecting HEAD with 403 or 405
+            self._logger.debug(f"HEAD request to {url!r} failed.", exc_info=exc)
+            return url, None, False
+        size = resp.headers.get("content-length")
+        ranged = (
+            size is not None
+            and int(size) >= 2 * self._RANGE_PART_SIZE
+            and resp.headers.get("accept-ranges") == "bytes"
+            and "content-encoding" not in resp.headers
+        )
+        return resp.url, None if size is None else int(size), ranged
+
+    def _progress_bar(
+        self, version: BinaryVersion, total: Optional[int], show_progress: bool
+    ) -> ContextManager:
+        """Progress bar for downloading `version`, or a no-op context."""
+        if not show_progress:
+            return contextlib.nullcontext()
+
+        import tqdm
+
+        return tqdm.tqdm(
+            total=total,
+            unit="b",
+            unit_scale=True,
+            desc=f"zkVyper v{version!s}",
+            mininterval=0.25,
+            smoothing=0,
+        )
+
+    def _download_ranges(
+        self,
+        url: str,
+        f: BinaryIO,
+        size: int,
+        prog=None,
+        workers: Optional[int] = None,
+    ) -> None:
+        """Download `url` into `f` with concurrent HTTP range requests.
+
+        Each part is written at its own offset with ``os.pwrite``, so no part is
+        buffered in memory and workers never share a file position.
+        """
+        fd = f.fileno()
+        parts = min(workers or self._RANGE_WORKERS, size // self._RANGE_PART_SIZE)
+        step = -(-size // parts)
+        # tqdm's update is not atomic, the workers share one bar
+        prog_lock = threading.Lock()
+
+        def fetch(start: int) -> None:
+            end = min(start + step, size)
+            headers = {"Range": f"bytes={start}-{end - 1}"}
+            with self._session.get(url, headers=headers, stream=True) as resp:
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise IOError(f"Range request ignored by {url!r}.")
+                offset, written, pending = start, 0, 0
+                for chunk in self._iter_body(resp):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    if prog is not None:
+                        written, pending = written + 1, pending + len(chunk)
+                        if written % self._PROGRESS_BATCH == 0:
+                            with prog_lock:
+                                prog.update(pending)
+                            pending = 0
+            if prog is not None and pending:
+                with prog_lock:
+                    prog.update(pending)
+            if offset != end:
+                raise IOError(f"Incomplete range {start}-{end - 1} from {url!r}.")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parts) as executor:
+            for future in [executor.submit(fetch, i) for i in range(0, size, step)]:
+                future.result()
+
+    def _iter_body(self, resp: "requests.Response") -> Iterator[bytes]:
+        """Chunks of the body of `resp`."""
+        if "content-encoding" in resp.headers:
+            return resp.iter_content(self._CHUNK_SIZE)
+        # nothing to decode, read urllib3's stream without requests' wrappers
+        return iter(functools.partial(resp.raw.read, self._CHUNK_SIZE), b"")
+
+    def _check_binary(self, fp: pathlib.Path, version: BinaryVersion) -> None:
+        """Check the binary at `fp` runs and reports `version`."""
+        ret = subprocess.run(
+            [fp.as_posix(), "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
         if ret.returncode != 0:
             logger.error(
                 "Downloaded binary would not execute, or returned unexpected output."
@@ -170,54 +485,236 @@ class VersionManager:
             fp.unlink()
             raise Exception()
 
-        self._logger.debug(f"Installation of v{version!s} finished.")
+    def _write_body(
+        self,
+        resp: "requests.Response",
+        f: BinaryIO,
+        prog=None,
+        digest: Optional["hashlib._Hash"] = None,
+    ) -> None:
+        """Write the body of `resp` to `f`, feeding it to `digest` if given.
+
+        Chunks are handed to a writer thread through a bounded queue, so the next
+        network read overlaps with the disk write of the previous chunk.
+        """
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=4)
+        failed = threading.Event()
+        errors: List[BaseException] = []
+
+        def writer() -> None:
+            written, pending = 0, 0
+            # keep draining after a failure so the producer never blocks on put
+            while (chunk := chunks.get()) is not None:
+                if failed.is_set():
+                    continue
+                try:
+                    f.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+                    if prog is not None:
+                        written, pending = written + 1, pending + len(chunk)
+                        if written % self._PROGRESS_BATCH == 0:
+                            prog.update(pending)
+                            pending = 0
+                except BaseException as exc:
+                    errors.append(exc)
+                    failed.set()
+            if prog is not None and pending:
+                prog.update(pending)
+
+        thread = threading.Thread(target=writer, daemon=True)
+        thread.start()
+        try:
+            for chunk in self._iter_body(resp):
+                if failed.is_set():
+                    break
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)
+            thread.join()
+
+        if errors:
+            raise errors[0]
 
     def uninstall(self, version: BinaryVersion):
         try:
-            pathlib.Path(urllib.parse.urlparse(version.location).path).unlink()
+            _uri_to_path(version.location).unlink()
         except FileNotFoundError:
             self._logger.warning(
                 f"zkVyper v{version!s} not found at {version.location!r}."
             )
         else:
+            self._local_cache = None
             self._logger.info(
                 f"Uninstalling zkVyper v{version!s} found at {version.location!r}."
             )
 
+    @functools.cached_property
+    def _session(self) -> "requests.Session":
+        # imported lazily, commands like `ls` never touch the network
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # sized for the parallel range downloads, retries transient failures
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = f"{__name__}/{__version__}"
+        return session
+
     @functools.cached_property
     def remote_versions(self) -> FrozenSet[BinaryVersion]:
-        """Remote zkVyper binary versions compatible with the host system."""
+        """Remote zkVyper binary versions compatible with the host system.
+
+        The parsed versions are pickled under ``cache_dir`` along with the listing's
+        ETag. A cache written less than ``_REMOTE_TTL`` seconds ago is used as is,
+        otherwise it is revalidated with a conditional request.
+        """
         remote_url = self._REMOTE_BASE_URL + self._platform_id
+        cache_fp: pathlib.Path = self._config["cache_dir"] / ".remote_versions.pkl"
+        cached = self._load_remote_cache(cache_fp)
+
+        headers = {}
+        # authenticated requests get a far higher GitHub API rate limit
+        if token := os.environ.get("GITHUB_TOKEN"):
+            headers["Authorization"] = f"Bearer {token}"
+        if cached is not None:
+            if time.time() - cache_fp.stat().st_mtime < self._REMOTE_TTL:
+                self._logger.debug("Using recently fetched remote zkVyper versions.")
+                return cached[1]
+            headers["If-None-Match"] = cached[0]
+
         self._logger.debug(f"Fetching remote zkVyper versions from {remote_url!r}.")
-        resp = self._session.get(remote_url)
+        resp = self._session.get(remote_url, headers=headers)
         resp.raise_for_status()
 
+        if cached is not None and resp.status_code == 304:
+            self._logger.debug("Remote zkVyper versions unchanged, using cache.")
+            os.utime(cache_fp)
+            return cached[1]
+
         versions = set()
-        for file in resp.json():
-            if file["type"] != "file":
+        for file in _loads(resp.content):
+            if file["type"] != "file" or not (
+                m := self._REMOTE_NAME_RE.match(file["name"])
+            ):
+                continue
+            try:
+                version = BinaryVersion.from_string(
+                    m.group(1),
+                    location=file["download_url"],
+                    sha=file.get("sha"),
+                    size=file.get("size"),
+                )
+            except ValueError:
+                # e.g. leading zeros, which semver rejects
                 continue
-            version_string = file["name"].split("-")[-1][1:]
-            versions.add(BinaryVersion(version_string, location=file["download_url"]))
+            versions.add(version)
         self._logger.debug(f"Found {len(versions)} zkVyper versions.")
-        return frozenset(versions)
+
+        result = frozenset(versions)
+        if "etag" in resp.headers:
+            data = (resp.headers["etag"], result)
+            _atomic_write(cache_fp, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+        return result
+
+    def _load_remote_cache(
+        self, cache_fp: pathlib.Path
+    ) -> Optional[Tuple[str, FrozenSet[BinaryVersion]]]:
+        """ETag and versions pickled by :attr:`remote_versions`, if readable."""
+        try:
+            with cache_fp.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # truncated, or written by an incompatible zkvvm release
+            self._logger.debug(
+                "Ignoring unreadable remote versions cache.", exc_info=exc
+            )
+            return None
 
     @property
     def local_versions(self) -> FrozenSet[BinaryVersion]:
         """Local zkVyper binary versions."""
+        return self._scan_local()[1]
+
+    @property
+    def _local_sorted(self) -> Tuple[BinaryVersion, ...]:
+        """:attr:`local_versions`, newest first."""
+        return self._scan_local()[2]
+
+    def _scan_local(
+        self,
+    ) -> Tuple[int, FrozenSet[BinaryVersion], Tuple[BinaryVersion, ...]]:
+        """Scan of ``cache_dir``, reused while its mtime is unchanged."""
+        cache_dir = os.fspath(self._config["cache_dir"])
+        mtime = os.stat(cache_dir).st_mtime_ns
+        if self._local_cache is not None and self._local_cache[0] == mtime:
+            return self._local_cache
+
+        # encode the directory once, entries only need their name quoted
+        prefix = _path_to_uri(cache_dir) + "/"
         versions = set()
-        cache_dir: pathlib.Path = self._config["cache_dir"]
-        for fp in cache_dir.iterdir():
-            if not fp.is_file():
-                continue
-            versions.add(BinaryVersion(fp.name.split("-")[-1], location=fp.as_uri()))
-        return frozenset(versions)
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if (
+                    not (m := self._LOCAL_NAME_RE.match(entry.name))
+                    or not entry.is_file()
+                ):
+                    continue
+                try:
+                    version = BinaryVersion.from_string(
+                        m.group(1), location=prefix + urllib.parse.quote(entry.name)
+                    )
+                except ValueError:
+                    # e.g. leading zeros, which semver rejects
+                    continue
+                versions.add(version)
+        self._local_cache = (
+            mtime,
+            frozenset(versions),
+            tuple(sorted(versions, reverse=True)),
+        )
+        return self._local_cache
+
+    @functools.cached_property
+    def _remote_sorted(self) -> Tuple[BinaryVersion, ...]:
+        """:attr:`remote_versions`, newest first."""
+        return tuple(sorted(self.remote_versions, reverse=True))
+
+    def _list_local_names(self) -> List[str]:
+        """Local zkVyper version strings, newest first.
+
+        Cheaper than :attr:`local_versions` for display, no ``Version`` is built.
+        """
+        with os.scandir(self._config["cache_dir"]) as it:
+            names = [
+                m.group(1)
+                for entry in it
+                if (m := self._LOCAL_NAME_RE.match(entry.name)) and entry.is_file()
+            ]
+        return sorted(filter(_is_version, names), key=_version_sort_key, reverse=True)
 
     def _get_logger(self):
         _logger = logger.getChild(self.__class__.__name__)
         _logger.setLevel(logging.DEBUG)
 
         if not _logger.hasHandlers():
-            fh = logging.FileHandler(self._config["log_file"])
+            log_file: pathlib.Path = self._config["log_file"]
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            # the log file is only opened once the first record is emitted
+            fh = logging.FileHandler(log_file, delay=True)
             fh.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
             _logger.addHandler(fh)
 
@@ -227,20 +724,73 @@ class VersionManager:
 
         return _logger
 
-    @functools.cached_property
+    @property
     def _platform_id(self) -> str:
-        """Platform identifier.
+        """Platform identifier."""
+        if _PLATFORM_ID is None:
+            raise PlatformError()
+        return _PLATFORM_ID
+
+
+def _path_to_uri(path: Union[str, pathlib.Path]) -> str:
+    """``file`` URI of `path`, made absolute and percent-encoded."""
+    return pathlib.Path(os.path.abspath(path)).as_uri()
 
-        See `Stack Overflow <https://stackoverflow.com/a/45125525>`_.
-        """
-        system, machine = platform.system(), platform.machine().lower()
-        if system == "Linux" and machine in self._AMD64:
-            return "linux-amd64"
-        elif system == "Darwin" and machine in self._AMD64:
-            return "macosx-amd64"
-        elif system == "Darwin" and machine in self._AMD64:
-            return "macosx-arm64"
-        raise PlatformError()
+
+def _uri_to_path(uri: str) -> pathlib.Path:
+    """Local path of the ``file`` URI `uri`."""
+    # what url2pathname does on POSIX, without importing urllib.request
+    return pathlib.Path(urllib.parse.unquote(urllib.parse.urlparse(uri).path))
+
+
+_VERSION_KEY_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-([^+]*))?")
+
+
+def _version_sort_key(
+    version_string: str,
+) -> Tuple[Tuple[int, ...], bool, Tuple[Tuple[int, int, str], ...]]:
+    """Sort key approximating semver precedence without a full parse."""
+    m = _VERSION_KEY_RE.match(version_string)
+    if m is None:
+        return ((), False, ((1, 0, version_string),))
+    major, minor, patch, prerelease = m.groups()
+    # numeric identifiers compare as integers, and below alphanumeric ones
+    identifiers = tuple(
+        (0, int(ident), "") if ident.isdigit() else (1, 0, ident)
+        for ident in (prerelease.split(".") if prerelease else ())
+    )
+    return ((int(major), int(minor), int(patch)), prerelease is None, identifiers)
+
+
+def _select(
+    spec: SimpleSpec, versions: Iterable[BinaryVersion]
+) -> Optional[BinaryVersion]:
+    """First version in `versions`, sorted newest first, matching `spec`."""
+    return next((v for v in versions if v in spec), None)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_file(f: IO[bytes]) -> Any:
+    """Parse the JSON document in `f`, mapping it into memory for ``orjson``."""
+    if orjson is None or os.fstat(f.fileno()).st_size == 0:
+        f.seek(0)
+        return _loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 
 def compile(srcfiles: List[Union[str, pathlib.Path]], **kwargs: Any) -> Dict[str, Dict]:
@@ -284,7 +834,9 @@ def main():
         default=config["zk_version"],
         type=Version,
     )
-    parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
 
     subparsers = parser.add_subparsers(title="commands", dest="command")
 
@@ -314,14 +866,15 @@ def main():
     if args.command is None:
         parser.print_help()
     elif args.command == "ls":
-        if vm.local_versions:
-            print(*[str(v) for v in sorted(vm.local_versions, reverse=True)], sep="\n")
+        names = vm._list_local_names()
+        if names:
+            print(*names, sep="\n")
         else:
             print("No local versions found.")
     elif args.command == "ls-remote":
-        print(*map(str, sorted(vm.remote_versions, reverse=True)), sep="\n")
+        print(*map(str, vm._remote_sorted), sep="\n")
     elif args.command == "install":
-        version = args.version.select(vm.remote_versions)
+        version = _select(args.version, vm._remote_sorted)
         if version:
             vm.install(version, args.overwrite)
         else:
@@ -335,7 +888,7 @@ def main():
         elif version is None:
             print("Version not found locally")
     elif args.command == "compile":
-        print(json.dumps(vm.compile(args.files)))
+        print(_dumps(vm.compile(args.files)))
 
 
 if __name__ == "__main__":